@@ -1,13 +1,92 @@
-import math
+import logging
+import queue
+import struct
 import threading
 import time
-from typing import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import Callable, NamedTuple
+import numpy as np
 import nkt_tools.NKTP_DLL as nkt
 
+logger = logging.getLogger(__name__)
+
+
+# bit positions of the FilterStatus fields in filter reg 0x66, in field order
+_FILTER_STATUS_BITS = (0, 1, 6, 7, 8, 10, 12, 16, 17, 18, 19, 20, 28, 29, 31)
+_FILTER_STATUS_MASKS = tuple(1 << k for k in _FILTER_STATUS_BITS)
+_FILTER_STATUS_SHIFTS = np.array(_FILTER_STATUS_BITS, dtype=np.uint32)
+
+# MAIN module status word (reg 0x66): decoded keys and their bit positions
+_MAIN_STATUS_KEYS = ("emission_on", "interlock_relays_off", "interlock_loop_open",
+                     "supply_voltage_low", "inlet_temp_out_of_range", "system_error_code_present")
+_MAIN_STATUS_MASKS = tuple(1 << k for k in (0, 1, 3, 5, 6, 15))
+
+# Precompiled layouts of the multi-field registers (little-endian, from byte 0)
+_U16_PAIR = struct.Struct("<HH")         # 0x32 center+bw, 0x35 bw limits, 0xE3 pixel range
+_FILTER_RECORD = struct.Struct("<HHI")   # 0x32 center, bw, power
+
+# RegisterResultTypes.RegResultNacked: the module received the telegram and refused it
+# (2 is RegResultFailed, a generic port failure)
+_REG_NACKED = 4
+
+# How many wavelength axes (reg 0xE5, one per pixel range) a connection keeps
+_WAVELENGTH_AXIS_CACHE_SIZE = 8
+
+
+def _sleep_until(deadline: float) -> None:
+    """
+    Sleep until time.perf_counter() reaches deadline (returns at once if it already passed).
+    No spinning: sub-millisecond accuracy is below a DLL round-trip anyway, and a spin
+    would compete with the GUI and I/O threads for the whole sweep.
+    """
+    remaining = deadline - time.perf_counter()
+    if remaining > 0:
+        time.sleep(remaining)
+
+
+class FilterStatus(NamedTuple):
+    """Decoded filter-module status word (reg 0x66)."""
+    shutter_open: bool
+    interlock_off: bool
+    module_temp_oob: bool
+    driver_temp_oob: bool
+    beam_dump_temp_oob: bool
+    image_ready: bool
+    output_ok: bool
+    lwp_moving: bool
+    swp_moving: bool
+    blocking_moving: bool
+    nd_moving: bool
+    shutter_moving: bool
+    motor_stalled: bool
+    filter_setting_changed: bool
+    motor_speed_degraded: bool
+
+    @classmethod
+    def from_bits(cls, bits: int) -> "FilterStatus":
+        return cls(*(bits & m != 0 for m in _FILTER_STATUS_MASKS))
+
+
+def status_bits_to_array(words) -> np.ndarray:
+    """
+    Decode many filter status words (reg 0x66) at once, e.g. a status log
+    recorded during a sweep. Returns an (N, 15) uint8 array of 0/1 flags whose
+    columns follow FilterStatus._fields.
+    """
+    w = np.asarray(words, dtype=np.uint32).reshape(-1, 1)
+    return ((w >> _FILTER_STATUS_SHIFTS) & 1).astype(np.uint8)
+
+
 class Chromatune():
     MAIN_MODULE_ADDRESS = 0xF
     FILTER_MODULE_ADDRESS = 0x07
 
+    # Measured filter tuning speed (nm/ms), or None if this unit hasn't been calibrated.
+    # When set, sweep_wavelength skips the idle poll for moves whose estimated duration
+    # (distance / slew) fits inside settle_ms; when None, wait_for_idle polls every setpoint.
+    slew_nm_per_ms: float | None = None
+
     def __init__(
         self,
         port_name: str,
@@ -20,6 +99,38 @@ class Chromatune():
     ):
         """Connects to the laser via ethernet and opens the port"""
         self.port_name = port_name
+        # last value written to / read from (dev, reg, index); lets setters skip redundant writes
+        self._reg_cache: dict[tuple[int, int, int], int] = {}
+        # identity registers that cannot change while the port is open
+        self._const_cache: dict[str, object] = {}
+        # spectrum pixel range (0xE3); only changes when the filter record (0x32) is rewritten
+        self._spectrum_range: tuple[int, int] | None = None
+        # wavelength axes by pixel range (start, end); oldest dropped past _WAVELENGTH_AXIS_CACHE_SIZE
+        self._wl_axes: dict[tuple[int, int], np.ndarray] = {}
+        # cleared if the module rejects a multi-field write to 0x32; set_filter then writes per field
+        self._filter_block_write = True
+        # where the device's array pointer (0x8F) is known to be, or None; lets the
+        # spectrum reads skip re-writing it. Whether reads auto-advance it is probed once.
+        self._array_offset: int | None = None
+        self._array_autoinc: bool | None = None
+        self._spectrum_pool: ThreadPoolExecutor | None = None
+        # held across multi-telegram sequences (array pointer + reads, cached writes) so
+        # other threads can't interleave register traffic in the middle of them
+        self._port_lock = threading.RLock()
+
+        # Bind the DLL register entry points once; the _read_*/_write_* helpers sit on every hot path
+        self._rd_u8, self._rd_s16 = nkt.registerReadU8, nkt.registerReadS16
+        self._rd_u16, self._rd_u32 = nkt.registerReadU16, nkt.registerReadU32
+        self._wr_u8, self._wr_u16, self._wr_u32 = nkt.registerWriteU8, nkt.registerWriteU16, nkt.registerWriteU32
+        self._rd_raw, self._wr_raw = nkt.registerRead, nkt.registerWrite
+        # ...and pre-apply (port, filter address) for the filter-module hot paths
+        # (status polling, sweep steps, spectrum array reads)
+        filt = (port_name, self.FILTER_MODULE_ADDRESS)
+        self._rd_u32_filt = partial(nkt.registerReadU32, *filt)
+        self._rd_raw_filt = partial(nkt.registerRead, *filt)
+        self._wr_u16_filt = partial(nkt.registerWriteU16, *filt)
+        self._wr_u32_filt = partial(nkt.registerWriteU32, *filt)
+
         port_data = nkt.pointToPointPortData(host_address, host_port, system_address, system_port, protocol_num, ms_timeout)
 
         add_res = nkt.pointToPointPortAdd(port_name, port_data)
@@ -29,8 +140,8 @@ class Chromatune():
         op_res = nkt.openPorts(port_name, autoMode=1, liveMode=1)
         if op_res != 0:
             raise RuntimeError(f"openPorts failed: {nkt.PortResultTypes(op_res)}")
-        
-        print("Successfully connected to Chromatune Laser")
+
+        logger.info("Connected to Chromatune laser on port %s", port_name)
 
 
     def close(self) -> None:
@@ -39,6 +150,10 @@ class Chromatune():
             self.set_emission(False)
         except Exception:
             pass
+        if self._spectrum_pool is not None:
+            self._spectrum_pool.shutdown(wait=False)
+        self._spectrum_pool = None
+        self._wl_axes.clear()
         try:
             nkt.closePorts(self.port_name)
         finally:
@@ -49,51 +164,155 @@ class Chromatune():
 
     # -------------------- helpers --------------------
 
+    @staticmethod
+    def _register_error(op: str, reg: int, res: int, value=None) -> RuntimeError:
+        """Build the error for a failed register call; only evaluated on the failure path."""
+        val = "" if value is None else f" val={value}"
+        return RuntimeError(f"{op} reg=0x{reg:02X}{val} failed: {nkt.RegisterResultTypes(res)}")
+
     def _read_u8(self, reg: int, index: int = -1, dev: int = None) -> int:
         dev = self.MAIN_MODULE_ADDRESS if dev is None else dev
-        res, val = nkt.registerReadU8(self.port_name, dev, reg, index)
+        res, val = self._rd_u8(self.port_name, dev, reg, index)
         if res != 0:
-            raise RuntimeError(f"registerReadU8 reg=0x{reg:02X} failed: {nkt.RegisterResultTypes(res)}")
+            raise self._register_error("registerReadU8", reg, res)
         return val
 
     def _read_s16(self, reg: int, index: int = -1, dev: int = None) -> int:
         dev = self.MAIN_MODULE_ADDRESS if dev is None else dev
-        res, val = nkt.registerReadS16(self.port_name, dev, reg, index)
+        res, val = self._rd_s16(self.port_name, dev, reg, index)
         if res != 0:
-            raise RuntimeError(f"registerReadS16 reg=0x{reg:02X} failed: {nkt.RegisterResultTypes(res)}")
+            raise self._register_error("registerReadS16", reg, res)
         return val
 
     def _read_u16(self, reg: int, index: int = -1, dev: int = None) -> int:
         dev = self.MAIN_MODULE_ADDRESS if dev is None else dev
-        res, val = nkt.registerReadU16(self.port_name, dev, reg, index)
+        res, val = self._rd_u16(self.port_name, dev, reg, index)
         if res != 0:
-            raise RuntimeError(f"registerReadU16 reg=0x{reg:02X} failed: {nkt.RegisterResultTypes(res)}")
+            raise self._register_error("registerReadU16", reg, res)
         return val
 
     def _read_u32(self, reg: int, index: int = -1, dev: int = None) -> int:
         dev = self.MAIN_MODULE_ADDRESS if dev is None else dev
-        res, val = nkt.registerReadU32(self.port_name, dev, reg, index)
+        res, val = self._rd_u32(self.port_name, dev, reg, index)
         if res != 0:
-            raise RuntimeError(f"registerReadU32 reg=0x{reg:02X} failed: {nkt.RegisterResultTypes(res)}")
+            raise self._register_error("registerReadU32", reg, res)
         return val
 
+    def _read_u32_filter(self, reg: int, index: int = -1) -> int:
+        """_read_u32 with the filter module address baked in; used by the status polls."""
+        res, val = self._rd_u32_filt(reg, index)
+        if res != 0:
+            raise self._register_error("registerReadU32", reg, res)
+        return val
+
+    def _read_bytes_filter(self, reg: int, index: int = -1) -> bytes:
+        res, data = self._rd_raw_filt(reg, index)
+        if res != 0:
+            raise self._register_error("registerRead", reg, res)
+        return data
+
+    def _read_bytes(self, reg: int, index: int = -1, dev: int = None) -> bytes:
+        dev = self.MAIN_MODULE_ADDRESS if dev is None else dev
+        res, data = self._rd_raw(self.port_name, dev, reg, index)
+        if res != 0:
+            raise self._register_error("registerRead", reg, res)
+        return data
+
+    def _read_fields(self, reg: int, layout: struct.Struct, dev: int = None) -> tuple:
+        """
+        Read every field of a multi-value register in one telegram and unpack
+        it with `layout` (one of the module-level Structs, starting at byte 0).
+        """
+        data = self._read_bytes(reg, index=0, dev=dev)
+        if len(data) < layout.size:
+            raise RuntimeError(f"registerRead reg=0x{reg:02X} returned {len(data)} bytes, expected {layout.size}")
+        return layout.unpack_from(data)
+
+    def _read_str(self, reg: int, max_len: int, index: int = -1, dev: int = None) -> str:
+        """Read an ASCII register in a single telegram, truncated to max_len characters."""
+        dev = self.MAIN_MODULE_ADDRESS if dev is None else dev
+        res, raw = nkt.registerReadAscii(self.port_name, dev, reg, index)
+        if res != 0:
+            raise self._register_error("registerReadAscii", reg, res)
+        # the wrapper returns the C string buffer's .value: bytes, already cut at the first NUL
+        return raw.decode("ascii", "replace")[:max_len]
+
     def _write_u8(self, reg: int, value: int, index: int = -1, dev: int = None) -> None:
         dev = self.MAIN_MODULE_ADDRESS if dev is None else dev
-        res = nkt.registerWriteU8(self.port_name, dev, reg, value, index)
+        res = self._wr_u8(self.port_name, dev, reg, value, index)
         if res != 0:
-            raise RuntimeError(f"registerWriteU8 reg=0x{reg:02X} val={value} failed: {nkt.RegisterResultTypes(res)}")
+            raise self._register_error("registerWriteU8", reg, res, value)
 
     def _write_u16(self, reg: int, value: int, index: int = -1, dev: int = None) -> None:
         dev = self.MAIN_MODULE_ADDRESS if dev is None else dev
-        res = nkt.registerWriteU16(self.port_name, dev, reg, value, index)
+        res = self._wr_u16(self.port_name, dev, reg, value, index)
+        if res != 0:
+            raise self._register_error("registerWriteU16", reg, res, value)
+
+    def _write_u16_filter(self, reg: int, value: int, index: int = -1) -> None:
+        """_write_u16 with the filter module address baked in; used on the sweep hot path."""
+        res = self._wr_u16_filt(reg, value, index)
+        if res != 0:
+            raise self._register_error("registerWriteU16", reg, res, value)
+
+    def _write_u32_filter(self, reg: int, value: int, index: int = -1) -> None:
+        res = self._wr_u32_filt(reg, value, index)
         if res != 0:
-            raise RuntimeError(f"registerWriteU16 reg=0x{reg:02X} val={value} failed: {nkt.RegisterResultTypes(res)}")
+            raise self._register_error("registerWriteU32", reg, res, value)
 
     def _write_u32(self, reg: int, value: int, index: int = -1, dev: int = None) -> None:
         dev = self.MAIN_MODULE_ADDRESS if dev is None else dev
-        res = nkt.registerWriteU32(self.port_name, dev, reg, value, index)
+        res = self._wr_u32(self.port_name, dev, reg, value, index)
         if res != 0:
-            raise RuntimeError(f"registerWriteU32 reg=0x{reg:02X} val={value} failed: {nkt.RegisterResultTypes(res)}")
+            raise self._register_error("registerWriteU32", reg, res, value)
+
+    def _write_bytes(self, reg: int, payload: bytes, index: int = -1, dev: int = None) -> None:
+        dev = self.MAIN_MODULE_ADDRESS if dev is None else dev
+        res = self._wr_raw(self.port_name, dev, reg, payload, len(payload), index)
+        if res != 0:
+            raise self._register_error("registerWrite", reg, res, payload.hex())
+
+
+    def _write_cached(self, writer: Callable, reg: int, value: int, index: int = -1, dev: int = None,
+                      force: bool = False) -> None:
+        """
+        Write through `writer` (e.g. self._write_u8) unless the register is known to hold value already.
+        force=True always writes; use it for values the user applied explicitly, since the device may
+        have changed the register on its own (front panel, interlock, another client).
+        """
+        dev = self.MAIN_MODULE_ADDRESS if dev is None else dev
+        key = (dev, reg, index)
+        with self._port_lock:
+            if not force and self._reg_cache.get(key) == value:
+                return
+            # forget the old value first so a failed write doesn't leave a stale entry behind
+            self._reg_cache.pop(key, None)
+            writer(reg, value, index, dev)
+            self._reg_cache[key] = value
+
+    def _read_cached(self, reader: Callable, reg: int, index: int = -1, dev: int = None) -> int:
+        """
+        Read through `reader` (e.g. self._read_u8) and record the value in the write-back cache.
+        The read and the cache update happen under _port_lock, so a concurrent _write_cached
+        can't land in between and have its value overwritten by the older one read here.
+        """
+        dev = self.MAIN_MODULE_ADDRESS if dev is None else dev
+        with self._port_lock:
+            value = reader(reg, index, dev)
+            self._reg_cache[(dev, reg, index)] = value
+        return value
+
+    def invalidate_cache(self) -> None:
+        """
+        Forget all cached register values (e.g. after the front panel or another
+        client changed settings), including the once-per-connection identity/limit reads.
+        """
+        with self._port_lock:
+            self._reg_cache.clear()
+        self._const_cache.clear()
+        self._wl_axes.clear()
+        self._spectrum_range = None
+        self._array_offset = None
 
 
     # -------------------- MAIN module API --------------------
@@ -193,24 +412,20 @@ class Chromatune():
 
     # System type (0x6B, U8: 0=EXTREME, 1=FIANIUM on older variants; Chromatune main says 0x01)
     def get_system_type(self) -> int:
-        return self._read_u8(0x6B, -1)
+        if "system_type" not in self._const_cache:
+            self._const_cache["system_type"] = self._read_u8(0x6B, -1)
+        return self._const_cache["system_type"]
     
 
     # Status bits (0x66, U16)
-    # def get_status_bits(self) -> int:
-    #     return self._read_u16(0x66, -1)
+    def get_status_bits(self) -> int:
+        """reg 0x66 (U16)."""
+        return self._read_u16(0x66)
     
-    # def status_dict(self) -> dict:
-    #     """Decode a few commonly-used status bits from reg 0x66."""
-    #     bits = self.get_status_bits()
-    #     return {
-    #         "emission_on": bool(bits & (1 << 0)),
-    #         "interlock_relays_off": bool(bits & (1 << 1)),
-    #         "interlock_loop_open": bool(bits & (1 << 3)),
-    #         "supply_voltage_low": bool(bits & (1 << 5)),
-    #         "inlet_temp_out_of_range": bool(bits & (1 << 6)),
-    #         "system_error_code_present": bool(bits & (1 << 15)),
-    #     }
+    def status_dict(self) -> dict:
+        """Decode a few commonly-used status bits from reg 0x66."""
+        bits = self.get_status_bits()
+        return dict(zip(_MAIN_STATUS_KEYS, (bits & m != 0 for m in _MAIN_STATUS_MASKS)))
     
 
     # -------------------- FILTER module (dev 0x07) --------------------
@@ -218,109 +433,161 @@ class Chromatune():
     # --- basic controls ---
     def get_shutter_mode(self) -> int:
         """reg 0x30 (U8): 0=closed, 1=open, 2=auto."""
-        return self._read_u8(0x30, dev=self.FILTER_MODULE_ADDRESS)
+        return self._read_cached(self._read_u8, 0x30, dev=self.FILTER_MODULE_ADDRESS)
 
-    def set_shutter_mode(self, mode: int) -> None:
+    def set_shutter_mode(self, mode: int, force: bool = False) -> None:
         if mode not in (0, 1, 2):
             raise ValueError("shutter mode must be 0(closed),1(open),2(auto)")
-        self._write_u8(0x30, mode, dev=self.FILTER_MODULE_ADDRESS)
+        self._write_cached(self._write_u8, 0x30, mode, dev=self.FILTER_MODULE_ADDRESS, force=force)
 
     def get_power_mode(self) -> int:
         """reg 0x31 (U8): 0=Manual,1=Max,2=Passive,3=Active,4=Tracker."""
-        return self._read_u8(0x31, dev=self.FILTER_MODULE_ADDRESS)
+        return self._read_cached(self._read_u8, 0x31, dev=self.FILTER_MODULE_ADDRESS)
 
-    def set_power_mode(self, mode: int) -> None:
+    def set_power_mode(self, mode: int, force: bool = False) -> None:
         if mode not in (0, 1, 2, 3, 4):
             raise ValueError("power mode must be 0..4")
-        self._write_u8(0x31, mode, dev=self.FILTER_MODULE_ADDRESS)
+        self._write_cached(self._write_u8, 0x31, mode, dev=self.FILTER_MODULE_ADDRESS, force=force)
 
 
     # --- filter setting (center/bandwidth/power) ---
     def get_center_wavelength_nm(self) -> float:
-        v = self._read_u16(0x32, index=0, dev=self.FILTER_MODULE_ADDRESS)
-        return v / 10.0
-
-    def set_center_wavelength_nm(self, nm: float) -> None:
-        self._write_u16(0x32, int(round(nm * 10)), index=0, dev=self.FILTER_MODULE_ADDRESS)
+        return self._read_cached(self._read_u16, 0x32, index=0, dev=self.FILTER_MODULE_ADDRESS) / 10.0
+
+    def set_center_wavelength_nm(self, nm: float, force: bool = False) -> None:
+        if force:
+            with self._port_lock:
+                self._reg_cache.pop((self.FILTER_MODULE_ADDRESS, 0x32, 0), None)
+                self._set_center_code(int(round(nm * 10)))
+        else:
+            self._set_center_code(int(round(nm * 10)))
+
+    def _set_center_code(self, code: int) -> None:
+        """Write the center wavelength as a raw reg 0x32 code (0.1 nm units)."""
+        # same bookkeeping as _write_cached, inlined because sweep_wavelength calls this every step
+        key = (self.FILTER_MODULE_ADDRESS, 0x32, 0)
+        with self._port_lock:
+            if self._reg_cache.get(key) == code:
+                return
+            self._reg_cache.pop(key, None)
+            self._spectrum_range = None
+            self._write_u16_filter(0x32, code, 0)
+            self._reg_cache[key] = code
 
     def get_bandwidth_nm(self) -> float:
-        v = self._read_u16(0x32, index=2, dev=self.FILTER_MODULE_ADDRESS)   # byte offset 2
+        v = self._read_cached(self._read_u16, 0x32, index=2, dev=self.FILTER_MODULE_ADDRESS)   # byte offset 2
         return v / 10.0
 
-    def set_bandwidth_nm(self, nm: float) -> None:
-        self._write_u16(0x32, int(round(nm * 10)), index=2, dev=self.FILTER_MODULE_ADDRESS)
+    def set_bandwidth_nm(self, nm: float, force: bool = False) -> None:
+        self._spectrum_range = None
+        self._write_cached(self._write_u16, 0x32, int(round(nm * 10)), index=2, dev=self.FILTER_MODULE_ADDRESS,
+                           force=force)
 
     def get_filter_power_nw(self) -> int:
-        return self._read_u32(0x32, index=4, dev=self.FILTER_MODULE_ADDRESS)  # byte offset 4
+        return self._read_cached(self._read_u32, 0x32, index=4, dev=self.FILTER_MODULE_ADDRESS)  # byte offset 4
 
-    def set_filter_power_nw(self, power_nw: int) -> None:
+    def set_filter_power_nw(self, power_nw: int, force: bool = False) -> None:
         if power_nw < 0:
             raise ValueError("power must be >= 0 nW")
-        self._write_u32(0x32, int(power_nw), index=4, dev=self.FILTER_MODULE_ADDRESS)
-
-    def set_filter(self, center_nm: float, bandwidth_nm: float, power_nw: int | None = None) -> None:
-        self.set_center_wavelength_nm(center_nm)
-        self.set_bandwidth_nm(bandwidth_nm)
-        if power_nw is not None:
-            self.set_filter_power_nw(power_nw)
+        self._write_cached(self._write_u32, 0x32, int(power_nw), index=4, dev=self.FILTER_MODULE_ADDRESS,
+                           force=force)
+
+    def get_filter(self) -> tuple[float, float, int]:
+        """Read the whole 0x32 filter record in one telegram; returns (center_nm, bandwidth_nm, power_nw)."""
+        dev = self.FILTER_MODULE_ADDRESS
+        with self._port_lock:  # same read-then-cache atomicity as _read_cached
+            center, bw, power = self._read_fields(0x32, _FILTER_RECORD, dev=dev)
+            for i, v in ((0, center), (2, bw), (4, power)):
+                self._reg_cache[(dev, 0x32, i)] = v
+        return center / 10.0, bw / 10.0, power
+
+    def set_filter(self, center_nm: float, bandwidth_nm: float, power_nw: int | None = None,
+                   force: bool = False) -> None:
+        """
+        Write the 0x32 filter record (center, bandwidth[, power]) as one telegram starting at byte 0.
+        Falls back to one write per field if the module rejects the combined payload.
+        Skipped if the cache says the record already holds these values, unless force=True.
+        """
+        dev = self.FILTER_MODULE_ADDRESS
+        fields = [(0, int(round(center_nm * 10))), (2, int(round(bandwidth_nm * 10)))]
+        if power_nw is None:
+            payload = _U16_PAIR.pack(fields[0][1], fields[1][1])
+        else:
+            if power_nw < 0:
+                raise ValueError("power must be >= 0 nW")
+            fields.append((4, int(power_nw)))
+            payload = _FILTER_RECORD.pack(fields[0][1], fields[1][1], fields[2][1])
+
+        with self._port_lock:
+            if not force and all(self._reg_cache.get((dev, 0x32, i)) == v for i, v in fields):
+                return
+            for i, _ in fields:
+                self._reg_cache.pop((dev, 0x32, i), None)
+            self._spectrum_range = None
+            if self._filter_block_write:
+                res = self._wr_raw(self.port_name, dev, 0x32, payload, len(payload), 0)
+                if res == _REG_NACKED:
+                    # the module refused the payload itself; link errors below still raise
+                    self._filter_block_write = False
+                elif res != 0:
+                    raise self._register_error("registerWrite", 0x32, res, payload.hex())
+            if not self._filter_block_write:
+                self._write_u16_filter(0x32, fields[0][1], 0)
+                self._write_u16_filter(0x32, fields[1][1], 2)
+                if power_nw is not None:
+                    self._write_u32_filter(0x32, fields[2][1], 4)
+            for i, v in fields:
+                self._reg_cache[(dev, 0x32, i)] = v
 
 
 
     # --- ND filter ---
     def get_nd_attenuation_db(self) -> float:
         """reg 0x33 (U16, 0.001 dB)."""
-        v = self._read_u16(0x33, dev=self.FILTER_MODULE_ADDRESS)
-        return v / 1000.0
+        return self._read_cached(self._read_u16, 0x33, dev=self.FILTER_MODULE_ADDRESS) / 1000.0
 
-    def set_nd_attenuation_db(self, db: float) -> None:
+    def set_nd_attenuation_db(self, db: float, force: bool = False) -> None:
         if db < 0:
             raise ValueError("ND attenuation must be >= 0 dB")
-        self._write_u16(0x33, int(round(db * 1000)), dev=self.FILTER_MODULE_ADDRESS)
+        self._write_cached(self._write_u16, 0x33, int(round(db * 1000)), dev=self.FILTER_MODULE_ADDRESS,
+                           force=force)
 
 
     # --- limits & identity ---
     def get_bandwidth_limits_nm(self) -> tuple[float, float]:
-        """reg 0x35: (max,min) in 0.1 nm; returns (min, max) as floats."""
-        bw_max = self._read_u16(0x35, index=0, dev=self.FILTER_MODULE_ADDRESS) / 10.0
-        bw_min = self._read_u16(0x35, index=1, dev=self.FILTER_MODULE_ADDRESS) / 10.0
-        return (bw_min, bw_max)
+        """reg 0x35: (max,min) in 0.1 nm; returns (min, max) as floats. Read once per connection."""
+        if "bw_limits" not in self._const_cache:
+            bw_max, bw_min = self._read_fields(0x35, _U16_PAIR, dev=self.FILTER_MODULE_ADDRESS)
+            self._const_cache["bw_limits"] = (bw_min / 10.0, bw_max / 10.0)
+        return self._const_cache["bw_limits"]
 
     def get_filter_firmware(self) -> tuple[int, str]:
-        """reg 0x64: (U16 version, ASCII up to 64B)."""
-        ver = self._read_u16(0x64, dev=self.FILTER_MODULE_ADDRESS)
-        txt = self._read_str(0x64, 64, dev=self.FILTER_MODULE_ADDRESS)
-        return ver, txt
+        """reg 0x64: (U16 version, ASCII up to 64B). Read once per connection."""
+        if "filter_firmware" not in self._const_cache:
+            ver = self._read_u16(0x64, dev=self.FILTER_MODULE_ADDRESS)
+            txt = self._read_str(0x64, 64, dev=self.FILTER_MODULE_ADDRESS)
+            self._const_cache["filter_firmware"] = (ver, txt)
+        return self._const_cache["filter_firmware"]
 
     def get_filter_serial(self) -> str:
-        """reg 0x65: 8-char ASCII serial."""
-        return self._read_str(0x65, 8, dev=self.FILTER_MODULE_ADDRESS)
+        """reg 0x65: 8-char ASCII serial. Read once per connection."""
+        if "filter_serial" not in self._const_cache:
+            self._const_cache["filter_serial"] = self._read_str(0x65, 8, dev=self.FILTER_MODULE_ADDRESS)
+        return self._const_cache["filter_serial"]
 
 
     # --- status & telemetry ---
     def get_status_bits_filter(self) -> int:
         """reg 0x66 (U32)."""
-        return self._read_u32(0x66, dev=self.FILTER_MODULE_ADDRESS)
+        return self._read_u32_filter(0x66)
+
+    def get_filter_status(self) -> FilterStatus:
+        """Read reg 0x66 and decode it once into a FilterStatus."""
+        return FilterStatus.from_bits(self.get_status_bits_filter())
 
     def status_dict_filter(self) -> dict:
         """Decode common bits from reg 0x66."""
-        b = self.get_status_bits_filter()
-        return {
-            "shutter_open":           bool(b & (1 << 0)),
-            "interlock_off":          bool(b & (1 << 1)),
-            "module_temp_oob":        bool(b & (1 << 6)),
-            "driver_temp_oob":        bool(b & (1 << 7)),
-            "beam_dump_temp_oob":     bool(b & (1 << 8)),
-            "image_ready":            bool(b & (1 << 10)),
-            "output_ok":              bool(b & (1 << 12)),
-            "lwp_moving":             bool(b & (1 << 16)),
-            "swp_moving":             bool(b & (1 << 17)),
-            "blocking_moving":        bool(b & (1 << 18)),
-            "nd_moving":              bool(b & (1 << 19)),
-            "shutter_moving":         bool(b & (1 << 20)),
-            "motor_stalled":          bool(b & (1 << 28)),
-            "filter_setting_changed": bool(b & (1 << 29)),
-            "motor_speed_degraded":   bool(b & (1 << 31)),
-        }
+        return self.get_filter_status()._asdict()
 
     def get_photodiode_power_nw(self) -> int:
         """reg 0x76 (U32, nW)."""
@@ -333,20 +600,58 @@ class Chromatune():
     def get_runtime_seconds(self) -> int:
         """reg 0x80 (U32)."""
         return self._read_u32(0x80, dev=self.FILTER_MODULE_ADDRESS)
+
+    def read_status_snapshot(self) -> dict:
+        """
+        Read the filter settings and telemetry registers as one consistent snapshot.
+
+        The reads run back to back under _port_lock, so no other thread (e.g. a
+        sweep) can interleave register traffic with them. The NKT DLL gives no
+        guarantee that overlapping calls on one port are safe, so they are not
+        issued concurrently.
+        """
+        getters = {
+            "shutter_mode":           self.get_shutter_mode,
+            "power_mode":             self.get_power_mode,
+            "nd_attenuation_db":      self.get_nd_attenuation_db,
+            "photodiode_power_nw":    self.get_photodiode_power_nw,
+            "estimated_max_power_nw": self.get_estimated_max_power_nw,
+            "runtime_seconds":        self.get_runtime_seconds,
+            "status_bits":            self.get_status_bits_filter,
+        }
+        with self._port_lock:
+            return {name: fn() for name, fn in getters.items()}
+
+    def fast_status(self) -> tuple[int, int]:
+        """
+        Return (main status bits, filter status bits), both reg 0x66.
+        Both are read under one _port_lock hold, so they describe the same moment.
+        """
+        with self._port_lock:
+            return self.get_status_bits(), self.get_status_bits_filter()
     
 
     # --- Wavelength Sweep Scan ---
 
-    def _wait_filter_idle(self, timeout_s: float = 3.0, poll_s: float = 0.02) -> bool:
-        deadline = time.time() + timeout_s
-        while time.time() < deadline:
-            b = self.get_status_bits_filter()
-            moving = (b >> 16) & 0b1_1111  # bits 16..20
-            if moving == 0:
+    def _poll_filter_status(self, done: Callable[[int], bool], timeout_s: float, poll_s: float) -> bool:
+        """
+        Poll reg 0x66 until done(bits) is true or timeout_s elapses.
+        Polling starts at 2 ms and backs off geometrically to poll_s, so fast
+        transitions return almost immediately without hammering the link on slow ones.
+        """
+        deadline = time.monotonic() + timeout_s
+        delay = min(0.002, poll_s)
+        while time.monotonic() < deadline:
+            if done(self.get_status_bits_filter()):
                 return True
-            time.sleep(poll_s)
+            time.sleep(delay)
+            delay = min(delay * 1.5, poll_s)
         return False
 
+    def _wait_filter_idle(self, timeout_s: float = 3.0, poll_s: float = 0.02) -> bool:
+        """Wait until no filter motor is moving (0x66 bits 16..20 clear)."""
+        return self._poll_filter_status(lambda b: (b >> 16) & 0b1_1111 == 0, timeout_s, poll_s)
+
     def sweep_wavelength(
         self,
         start_nm: float,
@@ -360,6 +665,7 @@ class Chromatune():
         settle_ms: int = 50,
         read_power: bool = False,
         callback: Callable | None = None,
+        sync_callback: bool = False,
         stop_event: threading.Event | None = None,
     ) -> None:
         """
@@ -372,6 +678,19 @@ class Chromatune():
 
         t_backward_s:
           If None, use t_forward_s for the backward leg.
+
+        callback:
+          Called as callback(wavelength_nm=..., power_nw=...) after each step.
+          By default it runs on a separate worker thread so a slow consumer doesn't
+          delay the next register write. That means the filter may already be moving
+          to the next setpoint while the callback runs, and if the callback falls
+          behind, intermediate steps are skipped: it always gets the most recent one.
+          The sweep returns only after the last callback finished.
+
+        sync_callback:
+          Run callback on the sweep thread, before the dwell, so it sees every step
+          while the filter is still at that wavelength (e.g. for acquisition). A slow
+          callback then stretches the sweep.
         """
         if loops < 1:
             return
@@ -380,51 +699,103 @@ class Chromatune():
         bw_min, bw_max = self.get_bandwidth_limits_nm()  # (min,max)
         # Chromatune wavelength range isn’t in that call; assume caller picks a valid range.
 
-        # Build one leg as a list of setpoints and dwell time
+        # Build one leg as an array of register setpoints (0.1 nm codes), the dwell time,
+        # and which setpoints need the idle poll
         def make_leg(a_nm: float, b_nm: float, dur_s: float):
-            distance = abs(b_nm - a_nm)
-            steps = max(1, math.ceil(distance / max(step_nm, 1e-6)))
+            # work in the register's own 0.1 nm units; steps finer than that can't be set anyway
+            a10, b10 = int(round(a_nm * 10)), int(round(b_nm * 10))
+            step10 = max(1, int(round(step_nm * 10)))
+            steps = max(1, -(-abs(b10 - a10) // step10))  # ceil division
             dwell = dur_s / steps
-            # Generate inclusive endpoints (steps points)
-            if b_nm >= a_nm:
-                wls = [a_nm + i * (distance / steps) for i in range(steps)]
-                wls.append(b_nm)
-            else:
-                wls = [a_nm - i * (distance / steps) for i in range(steps)]
-                wls.append(b_nm)
-            return wls, dwell
+            # steps + 1 setpoints, endpoints inclusive
+            codes = (a10 + np.arange(steps + 1) * (b10 - a10) // steps).astype(np.uint16)
+            # With a calibrated slew rate, small moves finish well inside the settle time and
+            # polling status then only costs round-trips. The first setpoint (coming from wherever
+            # the filter was) and the second (first move after a turnaround) are always polled.
+            poll_idle = np.full(len(codes), wait_for_idle, dtype=bool)
+            if wait_for_idle and self.slew_nm_per_ms:
+                est_motion_ms = np.abs(np.diff(codes.astype(np.int32))) * 0.1 / self.slew_nm_per_ms
+                poll_idle[2:] = est_motion_ms[1:] >= settle_ms
+            return codes, dwell, poll_idle
 
         back_time = t_backward_s if t_backward_s is not None else t_forward_s
 
-        # Execute one leg (list of wavelengths)
-        def run_leg(wls: list[float], dwell_s: float):
-            for wl in wls:
-                if stop_event and stop_event.is_set():
+        def run_callback(wl: float, power: int | None):
+            try:
+                callback(wavelength_nm=wl, power_nw=power)
+            except Exception:
+                pass
+
+        # One callback thread fed through a single slot: a slow consumer gets the latest step
+        # instead of an ever-growing backlog. Only the sweep thread puts, so after evicting a
+        # stale entry the put_nowait always has room.
+        cb_q: queue.Queue | None = None
+        cb_thread: threading.Thread | None = None
+        if callback and not sync_callback:
+            cb_q = queue.Queue(maxsize=1)
+
+            def cb_worker():
+                while True:
+                    item = cb_q.get()
+                    if item is None:
+                        return
+                    run_callback(*item)
+
+            cb_thread = threading.Thread(target=cb_worker, name="chromatune-sweep-cb", daemon=True)
+            cb_thread.start()
+
+        def publish(wl: float, power: int | None):
+            try:
+                cb_q.put_nowait((wl, power))
+            except queue.Full:
+                try:
+                    cb_q.get_nowait()
+                except queue.Empty:
+                    pass
+                cb_q.put_nowait((wl, power))
+
+        # Execute one leg (array of register codes)
+        def run_leg(codes: np.ndarray, dwell_s: float, poll_idle: np.ndarray):
+            # bind everything the loop touches once per leg, not once per step
+            set_code = self._set_center_code
+            wait_idle = self._wait_filter_idle
+            read_pd = self.get_photodiode_power_nw
+            if not callback:
+                submit = None
+            elif sync_callback:
+                submit = run_callback
+            else:
+                submit = publish
+            sleep = time.sleep
+            stopped = stop_event.is_set if stop_event else (lambda: False)
+            settle_s = settle_ms / 1000.0
+            idle_timeout_s = min(dwell_s, 1.0)
+
+            # step i ends at t0 + (i + 1) * dwell_s, so a slow step borrows from
+            # the next one instead of pushing the whole schedule back
+            t0 = time.perf_counter()
+            for i, (code, poll) in enumerate(zip(codes.tolist(), poll_idle.tolist()), start=1):
+                if stopped():
                     return
-                self.set_center_wavelength_nm(wl)
-                if wait_for_idle:
-                    self._wait_filter_idle(timeout_s=min(dwell_s, 1.0))
-                if settle_ms > 0:
-                    time.sleep(settle_ms / 1000.0)
+                set_code(code)
+                if poll:
+                    wait_idle(timeout_s=idle_timeout_s)
+                if settle_s > 0:
+                    sleep(settle_s)
                 power = None
                 if read_power:
                     try:
-                        power = self.get_photodiode_power_nw()
+                        power = read_pd()
                     except Exception:
                         power = None
-                if callback:
-                    try:
-                        callback(wavelength_nm=wl, power_nw=power)
-                    except Exception:
-                        pass
-                # Use remaining dwell time for pacing
-                # (We already waited during settle + idle; this tops it up.)
+                if submit:
+                    submit(code / 10.0, power)
                 if dwell_s > 0:
-                    time.sleep(max(0.0, dwell_s - (settle_ms / 1000.0)))
+                    _sleep_until(t0 + i * dwell_s)
 
-        # Prepare forward/backward wavelength lists once
-        f_wls, f_dwell = make_leg(start_nm, end_nm, t_forward_s)
-        b_wls, b_dwell = make_leg(end_nm, start_nm, back_time)
+        # Prepare forward/backward setpoints once
+        f_leg = make_leg(start_nm, end_nm, t_forward_s)
+        b_leg = make_leg(end_nm, start_nm, back_time)
 
         # Ensure emission/shutter are in a sane state (best effort; ignore errors)
         try:
@@ -432,78 +803,154 @@ class Chromatune():
         except Exception:
             pass
 
+        # the filter may have been moved outside this driver since the last write;
+        # make sure the first setpoint goes out even if the cache says it's already there
+        with self._port_lock:
+            self._reg_cache.pop((self.FILTER_MODULE_ADDRESS, 0x32, 0), None)
+
         # Run the requested number of loops
-        for k in range(loops):
-            # even-numbered legs: forward; odd: backward
-            if (k % 2) == 0:
-                run_leg(f_wls, f_dwell)
-            else:
-                run_leg(b_wls, b_dwell)
+        try:
+            for k in range(loops):
+                # even-numbered legs: forward; odd: backward
+                if (k % 2) == 0:
+                    run_leg(*f_leg)
+                else:
+                    run_leg(*b_leg)
+        finally:
+            if cb_thread:
+                cb_q.put(None)  # blocks until the worker took the last step, then stops it
+                cb_thread.join()
 
 
     # --- spectrum ---
-    # def get_spectrum_range_pixels(self) -> tuple[int, int]:
-    #     """reg 0xE3: (start, end); count = end - start."""
-    #     start = self._read_u16(0xE3, index=0, dev=self.FILTER_MODULE_ADDRESS)
-    #     end   = self._read_u16(0xE3, index=1, dev=self.FILTER_MODULE_ADDRESS)
-    #     return start, end
-
-    # def _filter_status_bits(self) -> int:
-    #     return self._read_u32(0x66, dev=self.FILTER_MODULE_ADDRESS)
-
-    # def _wait_image_ready(self, timeout_s: float = 3.0, poll_s: float = 0.05) -> bool:
-    #     """Wait for 0x66 bit10 (image ready) AND bit0 (shutter open)."""
-    #     import time
-    #     deadline = time.time() + timeout_s
-    #     while time.time() < deadline:
-    #         b = self._filter_status_bits()
-    #         if (b & (1 << 10)) and (b & (1 << 0)):
-    #             return True
-    #         time.sleep(poll_s)
-    #     return False
-
-    # def _set_array_index_bytes(self, byte_offset: int) -> None:
-    #     """reg 0x8F (U32): byte offset for E4/E5 array reads."""
-    #     self._write_u32(0x8F, int(byte_offset), dev=self.FILTER_MODULE_ADDRESS)
-
-    # def read_wavelengths_nm(self) -> list[float]:
-    #     """
-    #     Read wavelength array (reg 0xE5). Values are U16 with 0.02 nm resolution.
-    #     Wavelengths are static; cache them if desired.
-    #     """
-    #     start, end = self.get_spectrum_range_pixels()
-    #     n = max(0, end - start)
-    #     wl_nm: list[float] = []
-    #     for i in range(n):
-    #         self._set_array_index_bytes(2 * i)                 # 2 bytes per U16
-    #         raw = self._read_u16(0xE5, dev=self.FILTER_MODULE_ADDRESS)
-    #         wl_nm.append(raw * 0.02)
-    #     return wl_nm
-
-    # def read_amplitudes(self) -> list[int]:
-    #     """
-    #     Read spectral amplitudes (reg 0xE4). Each element is U16.
-    #     Units reported in docs vary (uW/nm vs mW/nm); treat as raw counts and
-    #     scale per your firmware if needed.
-    #     """
-    #     if not self._wait_image_ready():
-    #         raise TimeoutError("Spectral image not ready / shutter not open (status 0x66)")
-
-    #     start, end = self.get_spectrum_range_pixels()
-    #     n = max(0, end - start)
-    #     amps: list[int] = []
-    #     for i in range(n):
-    #         self._set_array_index_bytes(2 * i)
-    #         raw = self._read_u16(0xE4, dev=self.FILTER_MODULE_ADDRESS)
-    #         amps.append(raw)
-    #     return amps
-
-    # def read_full_spectrum(self, refresh_wavelengths: bool = False) -> tuple[list[float], list[int]]:
-    #     """
-    #     Return (wavelengths_nm, amplitudes). Wavelengths are cached by default.
-    #     """
-    #     if not hasattr(self, "_cached_wl_nm") or refresh_wavelengths:
-    #         self._cached_wl_nm = self.read_wavelengths_nm()
-    #     amplitudes = self.read_amplitudes()
-    #     m = min(len(self._cached_wl_nm), len(amplitudes))
-    #     return self._cached_wl_nm[:m], amplitudes[:m]
+    def get_spectrum_range_pixels(self) -> tuple[int, int]:
+        """reg 0xE3: (start, end); count = end - start. Cached until the filter setting changes."""
+        if self._spectrum_range is None:
+            self._spectrum_range = self._read_fields(0xE3, _U16_PAIR, dev=self.FILTER_MODULE_ADDRESS)
+        return self._spectrum_range
+
+    def _wait_image_ready(self, timeout_s: float = 3.0, poll_s: float = 0.05) -> bool:
+        """Wait for 0x66 bit10 (image ready) AND bit0 (shutter open)."""
+        ready = (1 << 10) | (1 << 0)
+        return self._poll_filter_status(lambda b: b & ready == ready, timeout_s, poll_s)
+
+    def _set_array_index_bytes(self, byte_offset: int) -> None:
+        """reg 0x8F (U32): byte offset for E4/E5 array reads. Skipped if the pointer is already there."""
+        byte_offset = int(byte_offset)
+        if byte_offset == self._array_offset:
+            return
+        self._array_offset = None
+        self._write_u32_filter(0x8F, byte_offset)
+        self._array_offset = byte_offset
+
+    def _note_array_read(self, byte_offset: int, nbytes: int) -> None:
+        """Track the array pointer after reading nbytes at byte_offset, probing auto-advance on first use."""
+        if self._array_autoinc is None:
+            try:
+                pos = self._read_u32_filter(0x8F)
+            except RuntimeError:
+                pos = None
+            self._array_autoinc = pos == byte_offset + nbytes
+            self._array_offset = pos
+        else:
+            self._array_offset = byte_offset + nbytes if self._array_autoinc else byte_offset
+
+    def _read_array_u16(self, reg: int, n: int) -> np.ndarray:
+        """
+        Read n U16 elements from array register `reg` (0xE4/0xE5).
+
+        Each registerRead returns as many bytes as fit in one telegram, so the
+        array pointer (0x8F) is only moved once per telegram instead of once
+        per element, and not at all where the device already advanced it.
+        """
+        out = np.empty(n, dtype="<u2")
+        raw = memoryview(out).cast("B")  # fill the result in place, no intermediate buffers
+        nbytes = raw.nbytes
+        off = 0
+        # the 0x8F pointer is shared device state; keep other threads off the port until we're done
+        with self._port_lock:
+            while off < nbytes:
+                self._set_array_index_bytes(off)
+                self._array_offset = None  # unknown until the read succeeds
+                data = self._read_bytes_filter(reg)
+                if not data:
+                    raise RuntimeError(f"registerRead reg=0x{reg:02X} returned no data at byte offset {off}")
+                self._note_array_read(off, len(data))
+                k = min(len(data), nbytes - off)
+                raw[off:off + k] = data[:k]
+                off += k
+        return out
+
+    def _spectrum_pixel_count(self) -> int:
+        start, end = self.get_spectrum_range_pixels()
+        return max(0, end - start)
+
+    def read_wavelengths_nm(self) -> np.ndarray:
+        """
+        Read wavelength array (reg 0xE5). Values are U16 with 0.02 nm resolution.
+        Wavelengths are static; cache them if desired.
+        """
+        return self._read_wavelengths_nm(self._spectrum_pixel_count())
+
+    def _read_wavelengths_nm(self, n: int) -> np.ndarray:
+        return self._read_array_u16(0xE5, n) * 0.02
+
+    def read_amplitudes(self) -> np.ndarray:
+        """
+        Read spectral amplitudes (reg 0xE4) as a uint16 array.
+        Units reported in docs vary (uW/nm vs mW/nm); treat as raw counts and
+        scale per your firmware if needed.
+        """
+        return self._read_amplitudes(self._spectrum_pixel_count())
+
+    def _read_amplitudes(self, n: int) -> np.ndarray:
+        if not self._wait_image_ready():
+            raise TimeoutError("Spectral image not ready / shutter not open (status 0x66)")
+        return self._read_array_u16(0xE4, n)
+
+    def read_full_spectrum(self, refresh_wavelengths: bool = False) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Return (wavelengths_nm, amplitudes). Wavelengths are cached by default.
+        The pixel range (0xE3) is read once and shared by both arrays.
+        """
+        start, end = self.get_spectrum_range_pixels()
+        wl = self._wavelength_axis(start, end, refresh_wavelengths)
+        amplitudes = self._read_amplitudes(max(0, end - start))
+        m = min(len(wl), len(amplitudes))
+        return wl[:m], amplitudes[:m]
+
+    def _wavelength_axis(self, start: int, end: int, refresh: bool = False) -> np.ndarray:
+        """Wavelength array for pixel range [start, end), cached per connection."""
+        key = (start, end)
+        wl = None if refresh else self._wl_axes.get(key)
+        if wl is None:
+            wl = self._read_wavelengths_nm(max(0, end - start))
+            wl.setflags(write=False)  # shared between callers
+            self._wl_axes.pop(key, None)
+            if len(self._wl_axes) >= _WAVELENGTH_AXIS_CACHE_SIZE:
+                del self._wl_axes[next(iter(self._wl_axes))]
+            self._wl_axes[key] = wl
+        return wl
+
+    def prefetch(self) -> None:
+        """
+        Warm the identity and limits caches so later calls don't have to go to
+        the device. Safe to run on a background thread. The spectrum registers
+        are left alone; the wavelength axis is read on the first spectrum read.
+        """
+        self.get_system_type()
+        self.get_filter_serial()
+        self.get_filter_firmware()
+        self.get_bandwidth_limits_nm()
+
+    def read_full_spectrum_async(self, refresh_wavelengths: bool = False) -> Future:
+        """
+        Start read_full_spectrum on a background thread and return its Future.
+
+        Lets a sweep/analysis loop request the next spectrum, keep processing
+        the previous one, and only block on .result() when it is needed.
+        Requests run one at a time, in submission order.
+        """
+        if self._spectrum_pool is None:
+            self._spectrum_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="chromatune-spectrum")
+        return self._spectrum_pool.submit(self.read_full_spectrum, refresh_wavelengths)
@@ -1,12 +1,76 @@
+import logging
+import queue
 import threading
+import time
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
-from typing import Optional
+from tkinter import ttk, filedialog
+from typing import NamedTuple, Optional
+
+import numpy as np
 
 from chromatune import Chromatune
 
+logger = logging.getLogger(__name__)
+
+# spectrum plot margin (px) around the axes box
+_SPEC_MARGIN = 32
+
+
+def _minmax_decimate(x: np.ndarray, y: np.ndarray, buckets: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce (x, y) to at most ~2 * buckets points by keeping the smallest and
+    largest y of each bucket, in sample order, so narrow peaks survive.
+    """
+    n = len(y)
+    if n <= 2 * buckets:
+        return x, y
+    k = n // buckets
+    m = buckets * k
+    yb = y[:m].reshape(buckets, k)
+    base = np.arange(0, m, k)
+    i_lo = base + yb.argmin(axis=1)
+    i_hi = base + yb.argmax(axis=1)
+    idx = np.column_stack((np.minimum(i_lo, i_hi), np.maximum(i_lo, i_hi))).ravel()
+    if m < n:
+        # leftover samples form one short last bucket
+        lo, hi = m + y[m:].argmin(), m + y[m:].argmax()
+        # a single leftover sample (or a flat tail) is one point, not the same one twice
+        idx = np.append(idx, (lo,) if lo == hi else (min(lo, hi), max(lo, hi)))
+    return x[idx], y[idx]
+
+
+class _SpectrumEnvelope(NamedTuple):
+    """Decimated spectrum for a plot `columns` pixels wide, plus the full-data ranges."""
+    columns: int
+    wl: np.ndarray
+    amp: np.ndarray
+    xmin: float
+    xmax: float
+    ymin: float
+    ymax: float
+
+
+def _spectrum_envelope(wl, amp, columns: int) -> _SpectrumEnvelope:
+    n = min(len(wl), len(amp))
+    wl = np.asarray(wl[:n], dtype=np.float64)
+    amp = np.asarray(amp[:n], dtype=np.float64)
+    wl_d, amp_d = _minmax_decimate(wl, amp, columns)
+    # the wavelength axis is monotonic, so its range is its endpoints; the envelope keeps
+    # every bucket's extremes, so its min/max are the full spectrum's
+    xmin, xmax = min(wl[0], wl[-1]), max(wl[0], wl[-1])
+    ymin, ymax = amp_d.min(), amp_d.max()
+    if ymax == ymin:
+        ymax = ymin + 1
+    return _SpectrumEnvelope(columns, wl_d, amp_d, xmin, xmax, ymin, ymax)
+
 
 class ChromatuneGUI:
+    # The spectrum panel was commented out in the original GUI while its read path
+    # (0xE3/0xE4/0xE5 via read_full_spectrum) was still being debugged. That path has had
+    # fixes since (bytes from registerReadAscii, no identity reads per spectrum), but hasn't
+    # been confirmed against the real DLL yet; keep the panel hidden until it is.
+    SHOW_SPECTRUM_PANEL = False
+
     def __init__(self, master: tk.Tk):
         self.master = master
         self.master.title("SuperK Chromatune Controller")
@@ -15,8 +79,16 @@ class ChromatuneGUI:
         # -------- Device handle --------
         self.dev: Optional[Chromatune] = None
         self._status_job = None
-        self._cached_wl = None
-        self._last_spectrum = ([], [])
+        self._status_busy = False   # a periodic status read is queued or running
+        self._status_gen = 0        # bumped on (re)schedule/cancel so stale replies are ignored
+        self._status_next = 0.0     # monotonic time the next periodic read is due
+        self._status_err: Optional[str] = None  # last periodic-read error shown, so it's reported once
+        # last status words shown; the labels are only rewritten when these change
+        self._last_bits: Optional[int] = None
+        self._last_b: Optional[int] = None
+        self._last_spectrum = (np.empty(0), np.empty(0))
+        # decimated form of _last_spectrum for the current plot width
+        self._spec_env: Optional[_SpectrumEnvelope] = None
 
         # -------- Connection variables --------
         self.var_portname = tk.StringVar(value="superk")
@@ -26,6 +98,8 @@ class ChromatuneGUI:
         self.var_sys_port = tk.IntVar(value=10001)
         self.var_timeout = tk.IntVar(value=100)
         self.var_protocol = tk.IntVar(value=0)  # 0 TCP
+        # periodic status polling is opt-in; "Refresh Status" reads on demand
+        self.var_auto_status = tk.BooleanVar(value=False)
 
         # -------- MAIN module variables --------
         self.var_emission = tk.BooleanVar(value=False)
@@ -54,13 +128,30 @@ class ChromatuneGUI:
 
         self._sweep_thread: Optional[threading.Thread] = None
         self._sweep_stop   = threading.Event()
+        # latest (wavelength_nm, power_nw) from the sweep worker; drained ~30 Hz on the Tk thread
+        self._sweep_latest: list = [None]
+        self._fmt_sweep = "{:.2f} nm".format
+        self._fmt_sweep_power = "{:.2f} nm, {} nW".format
+
+        # device commands from the GUI run one at a time on the I/O thread, in click order;
+        # (callback, args) pairs come back through _io_results and are applied on the Tk thread
+        self._io_q: queue.Queue = queue.Queue()
+        self._io_results: queue.SimpleQueue = queue.SimpleQueue()
+        self._io_thread = threading.Thread(target=self._io_loop, daemon=True)
+        self._io_thread.start()
+        # set-points clicked within one 100 ms window: only the last value per control is sent
+        self._pending_set: dict[str, tuple] = {}
+        self._set_job = None
 
         # build UI
         self._build_ui()
+        self.master.after(50, self._drain_io_results)
 
     # ================= UI LAYOUT =================
 
     def _build_ui(self):
+        # keep the window unmapped while ~50 widgets are gridded, then lay it out once
+        self.master.withdraw()
         pad = {"padx": 8, "pady": 6}
 
         # ---- Connection frame ----
@@ -126,9 +217,11 @@ class ChromatuneGUI:
         ttk.Button(frm_main, text="Reset Interlock", command=self.on_reset_interlock).grid(row=2, column=0, padx=4, pady=2)
         ttk.Button(frm_main, text="Disable Interlock", command=self.on_disable_interlock).grid(row=2, column=1, padx=4, pady=2)
 
-        # ttk.Button(frm_main, text="Refresh Status", command=self.refresh_status_once).grid(row=2, column=4, padx=4)
-        # self.lbl_status_main = ttk.Label(frm_main, text="status: —")
-        # self.lbl_status_main.grid(row=2, column=5, sticky="w")
+        ttk.Checkbutton(frm_main, text="Auto-refresh", variable=self.var_auto_status,
+                        command=self.on_toggle_auto_status).grid(row=2, column=3, padx=4)
+        ttk.Button(frm_main, text="Refresh Status", command=self.refresh_status_once).grid(row=2, column=4, padx=4)
+        self.lbl_status_main = ttk.Label(frm_main, text="status: —")
+        self.lbl_status_main.grid(row=2, column=5, sticky="w")
 
         # Disclaimer / caption at the bottom
         lbl_disclaimer = ttk.Label(
@@ -167,19 +260,24 @@ class ChromatuneGUI:
         cmb_pwr.bind("<<ComboboxSelected>>", self.on_set_power_mode)
         cmb_pwr.grid(row=0, column=3, padx=4)
 
+        # numeric entries are checked once when they lose focus, not on every keystroke;
+        # the Set buttons remain the only path that writes to the device
+        num = dict(validate="focusout", validatecommand=(self.master.register(self._is_float), "%P"),
+                   invalidcommand=self.master.bell)
+
         ttk.Label(frm_f, text="Center (nm)").grid(row=1, column=0, sticky="e")
-        ttk.Entry(frm_f, textvariable=self.var_center_nm, width=8).grid(row=1, column=1, sticky="w")
+        ttk.Entry(frm_f, textvariable=self.var_center_nm, width=8, **num).grid(row=1, column=1, sticky="w")
         ttk.Label(frm_f, text="BW (nm)").grid(row=1, column=2, sticky="e")
-        ttk.Entry(frm_f, textvariable=self.var_bw_nm, width=8).grid(row=1, column=3, sticky="w")
+        ttk.Entry(frm_f, textvariable=self.var_bw_nm, width=8, **num).grid(row=1, column=3, sticky="w")
         ttk.Button(frm_f, text="Set Filter", command=self.on_set_filter).grid(row=1, column=4, padx=6)
 
         ttk.Label(frm_f, text="ND (dB)").grid(row=2, column=0, sticky="e")
-        ttk.Entry(frm_f, textvariable=self.var_nd_db, width=8).grid(row=2, column=1, sticky="w")
+        ttk.Entry(frm_f, textvariable=self.var_nd_db, width=8, **num).grid(row=2, column=1, sticky="w")
         ttk.Button(frm_f, text="Set ND", command=self.on_set_nd).grid(row=2, column=2, padx=6)
 
-        # ttk.Button(frm_f, text="Refresh Filter Status", command=self.refresh_status_once).grid(row=2, column=4, padx=6)
-        # self.lbl_status_filter = ttk.Label(frm_f, text="status: —")
-        # self.lbl_status_filter.grid(row=2, column=5, sticky="w")
+        ttk.Button(frm_f, text="Refresh Filter Status", command=self.refresh_status_once).grid(row=2, column=4, padx=6)
+        self.lbl_status_filter = ttk.Label(frm_f, text="status: —")
+        self.lbl_status_filter.grid(row=2, column=5, sticky="w")
 
 
         # ---- Wavelength Sweep frame ----
@@ -244,31 +342,74 @@ class ChromatuneGUI:
             frm_w.grid_columnconfigure(c, weight=1)
 
 
-        # ---- Spectrum frame ----
-        # frm_s = ttk.LabelFrame(self.master, text="Spectrum")
-        # frm_s.grid(row=3, column=0, sticky="nsew", **pad)
+        # ---- Status bar ----
+        # errors and confirmations go here instead of modal dialogs, which would
+        # block the Tk loop (and any pending after() callbacks) until dismissed
+        self.lbl_status_bar = ttk.Label(self.master, text="Not connected.", anchor="w")
+        self.lbl_status_bar.grid(row=5, column=0, sticky="ew", padx=8, pady=(0, 6))
 
-        # ttk.Button(frm_s, text="Read Full Spectrum", command=self.on_read_spectrum).grid(row=0, column=0, padx=4)
-        # ttk.Button(frm_s, text="Save CSV…", command=self.on_save_csv).grid(row=0, column=1, padx=4)
-        # self.lbl_spec_info = ttk.Label(frm_s, text="N=0")
-        # self.lbl_spec_info.grid(row=0, column=2, padx=6)
-
-        # self.canvas = tk.Canvas(frm_s, width=640, height=240, bg="white", highlightthickness=1, highlightbackground="#ccc")
-        # self.canvas.grid(row=1, column=0, columnspan=6, padx=4, pady=4, sticky="nsew")
+        # ---- Spectrum frame ----
+        # built but only shown with SHOW_SPECTRUM_PANEL (see there)
+        frm_s = ttk.LabelFrame(self.master, text="Spectrum")
+        if self.SHOW_SPECTRUM_PANEL:
+            frm_s.grid(row=3, column=0, sticky="nsew", **pad)
+
+        ttk.Button(frm_s, text="Read Full Spectrum", command=self.on_read_spectrum).grid(row=0, column=0, padx=4)
+        ttk.Button(frm_s, text="Save CSV…", command=self.on_save_csv).grid(row=0, column=1, padx=4)
+        self.lbl_spec_info = ttk.Label(frm_s, text="N=0")
+        self.lbl_spec_info.grid(row=0, column=2, padx=6)
+
+        self.canvas = tk.Canvas(frm_s, width=640, height=240, bg="white", highlightthickness=1, highlightbackground="#ccc")
+        self.canvas.grid(row=1, column=0, columnspan=6, padx=4, pady=4, sticky="nsew")
+        # current canvas size, kept up to date by <Configure> so redraws don't query Tk for it
+        self._cw, self._ch = 640, 240
+        # interleaved (x, y) canvas coordinates, reused across redraws and grown on demand
+        self._pts_buf = np.empty((2048, 2))
+        self.canvas.bind("<Configure>", self._on_canvas_configure)
+        # raw Tcl entry point for the polyline update; Canvas.coords flattens its arguments
+        # and parses Tk's reply, which costs per point on a dense line
+        self._tk_call = self.master.tk.call
+        self._canvas_path = str(self.canvas)
+
+        # plot items are created once (hidden) and moved/relabelled on every redraw
+        spec = ("spec",)
+        self._spec_rect = self.canvas.create_rectangle(0, 0, 0, 0, outline="#999", tags=spec)
+        self._spec_line = self.canvas.create_line(0, 0, 0, 0, width=1, tags=spec)
+        self._spec_lbl_xmin = self.canvas.create_text(0, 0, anchor="w", tags=spec)
+        self._spec_lbl_xmax = self.canvas.create_text(0, 0, anchor="e", tags=spec)
+        self._spec_lbl_ymax = self.canvas.create_text(0, 0, anchor="ne", tags=spec)
+        self._spec_lbl_ymin = self.canvas.create_text(0, 0, anchor="se", tags=spec)
+        self.canvas.itemconfigure("spec", state="hidden")
+
+        # grid stretch
+        for r in range(4):
+            self.master.grid_rowconfigure(r, weight=0)
+        self.master.grid_rowconfigure(3, weight=1)
+        self.master.grid_columnconfigure(0, weight=1)
+        frm_s.grid_columnconfigure(5, weight=1)
+        frm_s.grid_rowconfigure(1, weight=1)
+
+        self.master.update_idletasks()
+        self.master.deiconify()
+
+    @staticmethod
+    def _is_float(text: str) -> bool:
+        try:
+            float(text)
+        except ValueError:
+            return False
+        return True
 
-        # # grid stretch
-        # for r in range(4):
-        #     self.master.grid_rowconfigure(r, weight=0)
-        # self.master.grid_rowconfigure(3, weight=1)
-        # self.master.grid_columnconfigure(0, weight=1)
-        # frm_s.grid_columnconfigure(5, weight=1)
-        # frm_s.grid_rowconfigure(1, weight=1)
+    def _notify(self, title: str, msg: str, level: str = "error"):
+        """Show a message in the status bar (Tk thread only) and log it."""
+        self.lbl_status_bar.config(text=f"{title}: {msg}", foreground="red" if level == "error" else "")
+        logger.log(logging.ERROR if level == "error" else logging.INFO, "%s: %s", title, msg)
 
     # ================= Event Handlers =================
 
     def on_connect(self):
         if self.dev is not None:
-            messagebox.showinfo("Already connected", "Device is already connected.")
+            self._notify("Already connected", "Device is already connected.", level="info")
             return
         try:
             self.dev = Chromatune(
@@ -280,180 +421,315 @@ class ChromatuneGUI:
                 protocol_num=int(self.var_protocol.get()),
                 ms_timeout=int(self.var_timeout.get()),
             )
-            # self._schedule_status_updates()
-            messagebox.showinfo("Connected", "Successfully connected to Chromatune.")
+            if self.var_auto_status.get():
+                self._schedule_status_updates()
+            # warm the driver caches in the background so the first button presses don't wait on the link
+            threading.Thread(target=self._prefetch_worker, args=(self.dev,), daemon=True).start()
+            self._notify("Connected", "Successfully connected to Chromatune.", level="info")
         except Exception as e:
             self.dev = None
-            messagebox.showerror("Connect failed", str(e))
+            self._notify("Connect failed", str(e))
 
-    def on_disconnect(self):
-        # self._cancel_status_updates()
+    @staticmethod
+    def _prefetch_worker(dev: Chromatune):
         try:
-            if self.dev:
-                self.dev.close()
-                messagebox.showinfo("Disconnected", "Successfully disconnected to Chromatune.")
-        finally:
-            self.dev = None
-            # self._cached_wl = None
-            # self._last_spectrum = ([], [])
-            # self.canvas.delete("all")
+            dev.prefetch()
+        except Exception:
+            pass  # best effort; the regular getters read the device on a cache miss
+
+    def on_disconnect(self):
+        self._cancel_status_updates()
+        self._last_bits = self._last_b = None
+        self._send_pending_setpoints()  # still send what the user clicked before disconnecting
+        dev, self.dev = self.dev, None
+        self._last_spectrum = (np.empty(0), np.empty(0))
+        self._spec_env = None
+        self.canvas.itemconfigure("spec", state="hidden")
+        if dev:
+            # queued behind any pending commands so they still reach the device;
+            # success is only reported once close() has actually returned
+            self._submit("Disconnect", dev.close, on_done=lambda _: self._notify(
+                "Disconnected", "Successfully disconnected to Chromatune.", level="info"))
 
     def on_close(self):
+        self._sweep_stop.set()  # a running sweep stops at its next step instead of outliving the window
         self.on_disconnect()
+        self._io_q.put(None)
+        # give the queued close a moment; the I/O thread is a daemon, so don't hold the window open for it
+        self._io_thread.join(timeout=0.5)
         self.master.destroy()
 
+    # ----- device I/O worker -----
+
+    def _submit(self, title: str, fn, *args, on_done=None):
+        """
+        Queue fn(*args) for the I/O thread and return immediately.
+        on_done(result) runs on the Tk thread; errors are reported under `title`.
+        """
+        # set-points still in their coalescing window were clicked earlier; they go first
+        self._send_pending_setpoints()
+        self._enqueue(title, fn, *args, on_done=on_done)
+
+    def _enqueue(self, title: str, fn, *args, on_done=None):
+        """
+        Queue fn(*args) for the I/O thread without flushing pending set-points.
+        For background traffic (status polling, sync markers) that the user didn't order
+        relative to their clicks; safe to call from any thread.
+        """
+        self._io_q.put((title, fn, args, on_done))
+
+    def _submit_setpoint(self, key: str, title: str, fn, *args):
+        """Like _submit, but repeated set-points for the same control within 100 ms collapse to the last one."""
+        self._pending_set[key] = (title, fn, args)
+        if self._set_job is None:
+            self._set_job = self.master.after(100, self._flush_setpoints)
+
+    def _send_pending_setpoints(self):
+        """Queue coalesced set-points now instead of at the end of their window (Tk thread only)."""
+        if self._set_job is not None:
+            self.master.after_cancel(self._set_job)
+            self._flush_setpoints()
+
+    def _flush_setpoints(self):
+        self._set_job = None
+        pending, self._pending_set = self._pending_set, {}
+        for title, fn, args in pending.values():
+            self._submit(title, fn, *args)
+
+    def _io_loop(self):
+        while True:
+            item = self._io_q.get()
+            if item is None:
+                return
+            title, fn, args, on_done = item
+            try:
+                res = fn(*args)
+            except Exception as e:
+                self._io_results.put((self._notify, (title, str(e))))
+            else:
+                if on_done:
+                    self._io_results.put((on_done, (res,)))
+
+    def _drain_io_results(self):
+        # the I/O thread never touches Tk itself; its results are applied here
+        self.master.after(50, self._drain_io_results)
+        while True:
+            try:
+                fn, args = self._io_results.get_nowait()
+            except queue.Empty:
+                break
+            fn(*args)
+
     # ----- main module controls -----
 
     def on_toggle_emission(self):
         if not self.dev:
             return
-        try:
-            self.dev.set_emission(self.var_emission.get())
-        except Exception as e:
-            messagebox.showerror("Emission", str(e))
+        self._submit("Emission", self.dev.set_emission, self.var_emission.get())
 
     def on_set_setup_mode(self, _event=None):
         if not self.dev:
             return
-        try:
-            # Extract the numeric prefix before ":"
-            mode = int(self.var_setup_mode.get().split(":")[0])
-            self.dev.set_setup_mode(mode)
-            print("New setup mode:", mode)
-        except Exception as e:
-            messagebox.showerror("Setup mode", str(e))
+        # Extract the numeric prefix before ":"
+        mode = int(self.var_setup_mode.get().split(":")[0])
+        self._submit("Setup mode", self.dev.set_setup_mode, mode,
+                     on_done=lambda _: logger.info("New setup mode: %d", mode))
 
     def on_set_watchdog(self):
         if not self.dev:
             return
         try:
-            self.dev.set_watchdog_seconds(int(self.var_watchdog.get()))
+            seconds = int(self.var_watchdog.get())
         except Exception as e:
-            messagebox.showerror("Watchdog", str(e))
+            self._notify("Watchdog", str(e))
+            return
+        self._submit("Watchdog", self.dev.set_watchdog_seconds, seconds)
 
     def on_set_power_permille(self):
         if not self.dev:
             return
-        if self.dev.get_setup_mode() != 1:
-            messagebox.showerror("Power Level", "Cannot change power in setup mode: " + str(self.dev.get_setup_mode()))
         try:
-            self.dev.set_power_level_permille(int(self.var_power_permille.get()))
+            level = int(self.var_power_permille.get())
         except Exception as e:
-            messagebox.showerror("Power level", str(e))
+            self._notify("Power level", str(e))
+            return
+        self._submit_setpoint("power", "Power level", self._set_level_in_mode,
+                              self.dev, 1, "power", self.dev.set_power_level_permille, level)
 
     def on_set_current_permille(self):
         if not self.dev:
             return
-        if self.dev.get_setup_mode() != 0:
-            messagebox.showerror("Current Level", "Cannot change current in setup mode: " + str(self.dev.get_setup_mode()))
         try:
-            self.dev.set_current_level_permille(int(self.var_current_permille.get()))
+            level = int(self.var_current_permille.get())
         except Exception as e:
-            messagebox.showerror("Current level", str(e))
+            self._notify("Current level", str(e))
+            return
+        self._submit_setpoint("current", "Current level", self._set_level_in_mode,
+                              self.dev, 0, "current", self.dev.set_current_level_permille, level)
+
+    @staticmethod
+    def _set_level_in_mode(dev: Chromatune, required_mode: int, what: str, setter, level: int):
+        # one safety read per action; don't write a level the current mode will ignore
+        mode = dev.get_setup_mode()
+        if mode != required_mode:
+            raise RuntimeError(f"Cannot change {what} in setup mode: {mode}")
+        setter(level)
 
     def on_reset_interlock(self):
         if not self.dev:
             return
-        try:
-            self.dev.reset_interlock()
-        except Exception as e:
-            messagebox.showerror("Interlock", str(e))
+        self._submit("Interlock", self.dev.reset_interlock)
 
     def on_disable_interlock(self):
         if not self.dev:
             return
-        try:
-            self.dev.disable_interlock()
-        except Exception as e:
-            messagebox.showerror("Interlock", str(e))
+        self._submit("Interlock", self.dev.disable_interlock)
 
     # ----- filter controls -----
 
+    @staticmethod
+    def _apply_setting(setter, *args):
+        # an explicit Set must reach the device even if the driver's write cache thinks the value
+        # is already there (front panel, interlock or another client may have changed it);
+        # force bypasses the cache for this one register only
+        setter(*args, force=True)
+
     def on_set_shutter_mode(self, _event=None):
         if not self.dev:
             return
-        try:
-            self.dev.set_shutter_mode(self.var_shutter_mode.get())
-        except Exception as e:
-            messagebox.showerror("Shutter mode", str(e))
+        self._submit("Shutter mode", self._apply_setting, self.dev.set_shutter_mode,
+                     self.var_shutter_mode.get())
 
     def on_set_power_mode(self, _event=None):
         if not self.dev:
             return
-        try:
-            self.dev.set_power_mode(self.var_power_mode.get())
-        except Exception as e:
-            messagebox.showerror("Power mode", str(e))
+        self._submit("Power mode", self._apply_setting, self.dev.set_power_mode,
+                     self.var_power_mode.get())
 
     def on_set_filter(self):
         if not self.dev:
             return
         try:
-            self.dev.set_filter(
-                center_nm=float(self.var_center_nm.get()),
-                bandwidth_nm=float(self.var_bw_nm.get()),
-            )
-            # new center/bw could change spectrum pixel mapping → refresh cache
-            self._cached_wl = None
+            center_nm = float(self.var_center_nm.get())
+            bandwidth_nm = float(self.var_bw_nm.get())
         except Exception as e:
-            messagebox.showerror("Set filter", str(e))
+            self._notify("Set filter", str(e))
+            return
+        # the driver drops its cached spectrum pixel range itself when the filter changes
+        self._submit_setpoint("filter", "Set filter", self._apply_setting, self.dev.set_filter,
+                              center_nm, bandwidth_nm)
 
     def on_set_nd(self):
         if not self.dev:
             return
         try:
-            self.dev.set_nd_attenuation_db(float(self.var_nd_db.get()))
+            db = float(self.var_nd_db.get())
         except Exception as e:
-            messagebox.showerror("ND attenuation", str(e))
+            self._notify("ND attenuation", str(e))
+            return
+        self._submit_setpoint("nd", "ND attenuation", self._apply_setting,
+                              self.dev.set_nd_attenuation_db, db)
 
     # ----- status -----
 
-    # def _schedule_status_updates(self):
-    #     self._cancel_status_updates()
-    #     self._status_job = self.master.after(500, self._status_tick)
-
-    # def _cancel_status_updates(self):
-    #     if self._status_job:
-    #         try:
-    #             self.master.after_cancel(self._status_job)
-    #         except Exception:
-    #             pass
-    #         self._status_job = None
-
-    # def _status_tick(self):
-    #     self.refresh_status_once()
-    #     self._status_job = self.master.after(1000, self._status_tick)
-
-    # def refresh_status_once(self):
-    #     if not self.dev:
-    #         return
-    #     try:
-    #         # main status
-    #         bits = self.dev.get_status_bits()
-    #         em_on = bool(bits & (1 << 0))
-    #         self.var_emission.set(em_on)
-    #         text_main = f"0x{bits:04X} (emission={'ON' if em_on else 'OFF'})"
-    #         self.lbl_status_main.configure(text=text_main)
-    #         # filter status
-    #         b = self.dev.get_status_bits_filter()
-    #         image_ready = bool(b & (1 << 10))
-    #         shutter_open = bool(b & (1 << 0))
-    #         text_filter = f"0x{b:08X} (img={'ready' if image_ready else '—'}, shutter={'open' if shutter_open else '—'})"
-    #         self.lbl_status_filter.configure(text=text_filter)
-    #     except Exception as e:
-    #         self.lbl_status_main.configure(text=f"status err: {e}")
-    #         self.lbl_status_filter.configure(text=f"status err: {e}")
+    def _schedule_status_updates(self):
+        self._cancel_status_updates()
+        self._status_err = None
+        self._status_next = time.monotonic() + 0.5
+        self._status_job = self.master.after(500, self._status_tick)
+
+    def _cancel_status_updates(self):
+        self._status_gen += 1
+        self._status_busy = False
+        if self._status_job:
+            try:
+                self.master.after_cancel(self._status_job)
+            except Exception:
+                pass
+            self._status_job = None
+
+    def on_toggle_auto_status(self):
+        if self.var_auto_status.get() and self.dev:
+            self._schedule_status_updates()
+        else:
+            self._cancel_status_updates()
+
+    def _status_tick(self):
+        # the next tick is scheduled when this read completes, so reads can never pile up
+        self._status_job = None
+        if not self.dev or self._status_busy:
+            return
+        gen = self._status_gen
+        if self._sweep_thread and self._sweep_thread.is_alive():
+            # leave the port to the sweep; keep the cadence and try again next tick
+            self._status_done(gen, None)
+            return
+        self._status_busy = True
+        # not _submit: a background tick must not cut short the set-point coalescing window
+        self._enqueue("Status", self._read_status_job, self.dev,
+                      on_done=lambda result: self._status_done(gen, result))
+
+    @staticmethod
+    def _read_status_job(dev: Chromatune):
+        try:
+            return dev.fast_status()
+        except Exception as e:
+            return e  # handed to _status_done so polling continues after an error
+
+    def _status_done(self, gen: int, result):
+        if gen != self._status_gen:
+            return  # polling was cancelled or restarted while this read was in flight
+        self._status_busy = False
+        if isinstance(result, Exception):
+            # a persistent error is reported once, not every second
+            msg = str(result)
+            if msg != self._status_err:
+                self._status_err = msg
+                self._notify("Status", msg)
+        elif result is not None:
+            self._status_err = None
+            self._show_status(result)
+        # 1 s cadence against the monotonic clock; if a read overran, start the next one now
+        # rather than firing a burst to catch up
+        now = time.monotonic()
+        self._status_next = max(self._status_next + 1.0, now)
+        self._status_job = self.master.after(int((self._status_next - now) * 1000), self._status_tick)
+
+    def refresh_status_once(self):
+        if not self.dev:
+            return
+        # both status words in one locked request, read on the I/O thread
+        self._submit("Status", self.dev.fast_status, on_done=self._show_status)
+
+    def _show_status(self, status: tuple[int, int]):
+        bits, b = status
+        # main status
+        em_on = bool(bits & (1 << 0))
+        # checked every tick, not only on change, so a failed toggle is still reverted
+        if self.var_emission.get() != em_on:
+            self.var_emission.set(em_on)
+        if bits != self._last_bits:
+            self._last_bits = bits
+            text_main = f"0x{bits:04X} (emission={'ON' if em_on else 'OFF'})"
+            self.lbl_status_main.configure(text=text_main)
+        # filter status
+        if b != self._last_b:
+            self._last_b = b
+            image_ready = bool(b & (1 << 10))
+            shutter_open = bool(b & (1 << 0))
+            text_filter = f"0x{b:08X} (img={'ready' if image_ready else '—'}, shutter={'open' if shutter_open else '—'})"
+            self.lbl_status_filter.configure(text=text_filter)
 
 
     # ----- wavelength sweep -----
 
     def on_start_sweep(self):
         if not self.dev:
-            messagebox.showerror("Sweep", "Not connected.")
+            self._notify("Sweep", "Not connected.")
             return
         # prevent double-start
         if self._sweep_thread and self._sweep_thread.is_alive():
-            messagebox.showinfo("Sweep", "Sweep already running.")
+            self._notify("Sweep", "Sweep already running.", level="info")
             return
 
         # read & validate inputs
@@ -471,7 +747,7 @@ class ChromatuneGUI:
             if t_fwd <= 0 or t_bwd <= 0 or step <= 0 or loops < 1 or settle_ms < 0:
                 raise ValueError("Times and step must be > 0; loops >= 1; settle_ms >= 0")
         except Exception as e:
-            messagebox.showerror("Sweep", f"Invalid inputs: {e}")
+            self._notify("Sweep", f"Invalid inputs: {e}")
             return
 
         # prepare stop flag and UI
@@ -479,11 +755,30 @@ class ChromatuneGUI:
         self._set_sweep_ui_running(True)
         self.lbl_sweep_status.config(text="Starting sweep…")
 
-        # launch worker
+        # launch worker; set-points clicked before Start must be on the I/O queue ahead of it
+        self._send_pending_setpoints()
         args = dict(start=start, end=end, t_fwd=t_fwd, t_bwd=t_bwd,
                     step=step, loops=loops, readp=readp, settle_ms=settle_ms, wait_idle=wait_idle)
         self._sweep_thread = threading.Thread(target=self._sweep_worker, args=(args,), daemon=True)
         self._sweep_thread.start()
+        self.master.after(33, self._drain_sweep_status)
+
+    def _drain_sweep_status(self):
+        latest = self._sweep_latest[0]
+        if latest is not None:
+            self._sweep_latest[0] = None
+            wavelength_nm, power_nw = latest
+            if power_nw is None:
+                txt = self._fmt_sweep(wavelength_nm)
+            else:
+                txt = self._fmt_sweep_power(wavelength_nm, power_nw)
+            try:
+                self.lbl_sweep_status.config(text=txt)
+            except tk.TclError as e:
+                # skip this frame but keep draining; the next tick shows a newer value anyway
+                logger.debug("sweep status update skipped: %s", e)
+        if self._sweep_thread and self._sweep_thread.is_alive():
+            self.master.after(33, self._drain_sweep_status)
 
     def on_stop_sweep(self):
         self._sweep_stop.set()
@@ -499,13 +794,15 @@ class ChromatuneGUI:
         pass
 
     def _sweep_worker(self, args: dict):
-        # optional: per-step logger
+        # per-step status: only publish the latest value, _drain_sweep_status picks it up
         def on_step(wavelength_nm: float, power_nw: int | None):
-            # update a small status line (thread-safe via after)
-            txt = f"{wavelength_nm:.2f} nm"
-            if power_nw is not None:
-                txt += f", {power_nw} nW"
-            self.master.after(0, lambda t=txt: self.lbl_sweep_status.config(text=t))
+            self._sweep_latest[0] = (wavelength_nm, power_nw)
+
+        # wait until the I/O thread has sent everything queued before Start,
+        # so e.g. a pending Set filter can't land in the middle of the sweep
+        synced = threading.Event()
+        self._enqueue("Sweep", synced.set)
+        synced.wait()
 
         try:
             # Make sure emission/shutter sane (best effort)
@@ -529,12 +826,13 @@ class ChromatuneGUI:
                 stop_event=self._sweep_stop,
             )
 
-            # finished or stopped
+            # finished or stopped; drop any pending step so it can't overwrite the final text
+            self._sweep_latest[0] = None
             self.master.after(0, lambda: self.lbl_sweep_status.config(
                 text="Stopped" if self._sweep_stop.is_set() else "Done"
             ))
         except Exception as e:
-            self.master.after(0, lambda e=e: messagebox.showerror("Sweep", str(e)))
+            self.master.after(0, lambda e=e: self._notify("Sweep", str(e)))
         finally:
             self.master.after(0, lambda: self._set_sweep_ui_running(False))
 
@@ -542,110 +840,110 @@ class ChromatuneGUI:
 
     # ----- spectrum -----
 
-    # def on_read_spectrum(self):
-    #     if not self.dev:
-    #         print("[DEBUG] Device not initialized, aborting spectrum read.")
-    #         return
-    #     print("[DEBUG] Starting background spectrum read thread...")
-    #     # run in background so UI doesn't freeze while waiting for image ready
-    #     t = threading.Thread(target=self._read_spectrum_worker, daemon=True)
-    #     t.start()
-
-    # def _read_spectrum_worker(self):
-    #     try:
-    #         print("[DEBUG] Spectrum worker started.")
-    #         # cache wavelengths once unless pixel count changed
-    #         if self._cached_wl is None:
-    #             print("[DEBUG] No cached wavelengths, reading from device...")
-    #             self._cached_wl = self.dev.read_wavelengths_nm()
-    #             print(f"[DEBUG] Cached wavelengths length: {len(self._cached_wl)}")
-    #         else:
-    #             print(f"[DEBUG] Using cached wavelengths length: {len(self._cached_wl)}")
-
-    #         wl, amp = self.dev.read_full_spectrum(refresh_wavelengths=False)
-    #         print(f"[DEBUG] Spectrum read complete. Length wl={len(wl)}, amp={len(amp)}")
-
-    #         self._last_spectrum = (wl, amp)
-    #         self._draw_spectrum(wl, amp)
-    #         print("[DEBUG] Spectrum drawn successfully.")
-
-    #     except Exception as e:
-    #         print(f"[ERROR] Exception in spectrum worker: {e}")
-    #         self.master.after(0, lambda e=e: messagebox.showerror("Spectrum", str(e)))
-
-    # def _draw_spectrum(self, wl, amp):
-    #     print("[DEBUG] Entered _draw_spectrum")
-    #     self.canvas.delete("all")
-    #     w = int(self.canvas["width"])
-    #     h = int(self.canvas["height"])
-    #     n = min(len(wl), len(amp))
-    #     print(f"[DEBUG] Drawing spectrum: n={n}, canvas size=({w}x{h})")
-
-    #     self.lbl_spec_info.configure(text=f"N={n}")
-    #     if n < 2:
-    #         print("[DEBUG] Not enough points to draw (n<2). Exiting draw.")
-    #         return
-
-    #     xmin, xmax = min(wl), max(wl)
-    #     ymin, ymax = min(amp), max(amp)
-    #     print(f"[DEBUG] X range: {xmin:.2f}-{xmax:.2f}, Y range: {ymin:.2f}-{ymax:.2f}")
-
-    #     if ymax == ymin:
-    #         print("[WARN] Ymax == Ymin, adjusting to avoid divide by zero.")
-    #         ymax = ymin + 1
-
-    #     # axes
-    #     margin = 32
-    #     x0, y0 = margin, h - margin
-    #     x1, y1 = w - margin, margin
-    #     self.canvas.create_rectangle(x0, y1, x1, y0, outline="#999")
-
-    #     # map helpers
-    #     def xmap(x):
-    #         return x0 + (x - xmin) * (x1 - x0) / (xmax - xmin) if xmax > xmin else x0
-
-    #     def ymap(y):
-    #         return y0 - (y - ymin) * (y0 - y1) / (ymax - ymin)
-
-    #     # polyline (downsample if very dense)
-    #     step = max(1, n // (x1 - x0))
-    #     print(f"[DEBUG] Plotting step size: {step}")
-    #     pts = []
-    #     for i in range(0, n, step):
-    #         pts.extend([xmap(wl[i]), ymap(amp[i])])
-    #     print(f"[DEBUG] Number of plotted points: {len(pts)//2}")
-
-    #     if len(pts) >= 4:
-    #         self.canvas.create_line(*pts, width=1)
-
-    #     # labels
-    #     self.canvas.create_text(x0, y1 - 12, anchor="w", text=f"{xmin:.2f} nm")
-    #     self.canvas.create_text(x1, y1 - 12, anchor="e", text=f"{xmax:.2f} nm")
-    #     self.canvas.create_text(x0 - 4, y1, anchor="ne", text=f"{int(ymax)}")
-    #     self.canvas.create_text(x0 - 4, y0, anchor="se", text=f"{int(ymin)}")
-
-    #     print("[DEBUG] Finished drawing spectrum.")
-
-
-    # # ----- export -----
-
-    # def on_save_csv(self):
-    #     wl, amp = self._last_spectrum
-    #     if not wl or not amp:
-    #         messagebox.showinfo("Save CSV", "No spectrum to save yet.")
-    #         return
-    #     path = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV", "*.csv")])
-    #     if not path:
-    #         return
-    #     try:
-    #         with open(path, "w", encoding="utf-8") as f:
-    #             f.write("wavelength_nm,amplitude\n")
-    #             for x, y in zip(wl, amp):
-    #                 f.write(f"{x:.6f},{y}\n")
-    #         messagebox.showinfo("Save CSV", f"Saved {len(wl)} points to {path}")
-    #     except Exception as e:
-    #         messagebox.showerror("Save CSV", str(e))
+    def on_read_spectrum(self):
+        if not self.dev:
+            return
+        # runs on the I/O thread so the UI doesn't freeze while waiting for image ready;
+        # the driver caches the wavelength axis
+        self._submit("Spectrum", self._read_spectrum_job, self.dev, self._plot_columns(),
+                     on_done=self._show_spectrum)
+
+    @staticmethod
+    def _read_spectrum_job(dev: Chromatune, columns: int):
+        # decimate here on the I/O thread; the Tk thread then only maps a few hundred points
+        wl, amp = dev.read_full_spectrum()
+        env = _spectrum_envelope(wl, amp, columns) if min(len(wl), len(amp)) >= 2 else None
+        return wl, amp, env
+
+    def _show_spectrum(self, result: tuple[np.ndarray, np.ndarray, Optional[_SpectrumEnvelope]]):
+        wl, amp, env = result
+        last_wl, last_amp = self._last_spectrum
+        self._last_spectrum = (wl, amp)
+        self._spec_env = env
+        # repeated reads often return the same image (emission off, image not refreshed yet)
+        if np.array_equal(amp, last_amp) and np.array_equal(wl, last_wl):
+            return
+        self._draw_spectrum(wl, amp)
+
+    def _plot_columns(self) -> int:
+        return max(1, self._cw - 2 * _SPEC_MARGIN)
 
+    def _on_canvas_configure(self, event):
+        self._cw, self._ch = event.width, event.height
+        if len(self._last_spectrum[0]):
+            self._draw_spectrum(*self._last_spectrum)
+
+    def _draw_spectrum(self, wl, amp):
+        c = self.canvas
+        w, h = self._cw, self._ch
+        n = min(len(wl), len(amp))
+
+        self.lbl_spec_info.configure(text=f"N={n}")
+        if n < 2:
+            c.itemconfigure("spec", state="hidden")
+            return
+
+        # polyline: at most a min/max pair per pixel column; only re-decimate if the width changed
+        env = self._spec_env
+        if env is None or env.columns != self._plot_columns():
+            env = self._spec_env = _spectrum_envelope(wl, amp, self._plot_columns())
+        wl_d, amp_d = env.wl, env.amp
+        xmin, xmax, ymin, ymax = env.xmin, env.xmax, env.ymin, env.ymax
+
+        # axes
+        margin = _SPEC_MARGIN
+        x0, y0 = margin, h - margin
+        x1, y1 = w - margin, margin
+        c.coords(self._spec_rect, x0, y1, x1, y0)
+
+        # map to canvas coordinates in one pass
+        k = len(wl_d)
+        if k > len(self._pts_buf):
+            self._pts_buf = np.empty((2 * k, 2))
+        pts = self._pts_buf[:k]
+        xs, ys = pts[:, 0], pts[:, 1]
+        if xmax > xmin:
+            np.subtract(wl_d, xmin, out=xs)
+            xs *= (x1 - x0) / (xmax - xmin)
+            xs += x0
+        else:
+            xs.fill(x0)
+        np.subtract(amp_d, ymin, out=ys)
+        ys *= -(y0 - y1) / (ymax - ymin)
+        ys += y0
+
+        # the coordinates travel as one Tcl list argument ("coords tagOrId coordList")
+        self._tk_call(self._canvas_path, "coords", self._spec_line, pts.ravel().tolist())
+
+        # labels
+        c.coords(self._spec_lbl_xmin, x0, y1 - 12)
+        c.itemconfigure(self._spec_lbl_xmin, text=f"{xmin:.2f} nm")
+        c.coords(self._spec_lbl_xmax, x1, y1 - 12)
+        c.itemconfigure(self._spec_lbl_xmax, text=f"{xmax:.2f} nm")
+        c.coords(self._spec_lbl_ymax, x0 - 4, y1)
+        c.itemconfigure(self._spec_lbl_ymax, text=f"{int(ymax)}")
+        c.coords(self._spec_lbl_ymin, x0 - 4, y0)
+        c.itemconfigure(self._spec_lbl_ymin, text=f"{int(ymin)}")
+        c.itemconfigure("spec", state="normal")
+
+
+    # ----- export -----
+
+    def on_save_csv(self):
+        wl, amp = self._last_spectrum
+        if len(wl) == 0 or len(amp) == 0:
+            self._notify("Save CSV", "No spectrum to save yet.", level="info")
+            return
+        path = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV", "*.csv")])
+        if not path:
+            return
+        try:
+            n = min(len(wl), len(amp))
+            np.savetxt(path, np.column_stack((wl[:n], amp[:n])), fmt=("%.6f", "%d"), delimiter=",",
+                       header="wavelength_nm,amplitude", comments="", encoding="utf-8")
+            self._notify("Save CSV", f"Saved {n} points to {path}", level="info")
+        except Exception as e:
+            self._notify("Save CSV", str(e))
 
 if __name__ == "__main__":
     root = tk.Tk()